@@ -1,54 +1,121 @@
-import json
+import os
 import sys
 
-def extract_keys_recursive(data, prefix=""):
-    keys = []
-    if isinstance(data, dict):
-        for key, value in data.items():
+import ijson
+
+NAMESPACES = ["common", "entities", "ui"]
+
+def _within_prefixes(key, allowed_prefixes):
+    # True if key is one of the prefixes or lies underneath one of them
+    return any(key == p or key.startswith(p + ".") for p in allowed_prefixes)
+
+def _leads_to_prefixes(key, allowed_prefixes):
+    # True if some prefix lies underneath key, so its subtree may still hold allowed keys
+    return any(p.startswith(key + ".") for p in allowed_prefixes)
+
+def extract_keys_into(data, out_set, prefix="", allowed_prefixes=None):
+    # Walk nested dicts with an explicit stack, adding string-leaf keys straight into out_set.
+    # With allowed_prefixes (a frozenset of dotted prefixes), only keys under those prefixes are
+    # collected and subtrees that cannot contain them are never visited
+    inside = allowed_prefixes is None or (bool(prefix) and _within_prefixes(prefix, allowed_prefixes))
+    stack = [(prefix, data, inside)] if type(data) is dict else []
+    while stack:
+        prefix, d, inside = stack.pop()
+        for key, value in d.items():
             current_key = f"{prefix}.{key}" if prefix else key
-            if isinstance(value, dict):
-                keys.extend(extract_keys_recursive(value, current_key))
-            elif isinstance(value, str):
-                keys.append(current_key)
-    return keys
+            within = inside or _within_prefixes(current_key, allowed_prefixes)
+            if type(value) is dict:
+                if within or _leads_to_prefixes(current_key, allowed_prefixes):
+                    stack.append((current_key, value, within))
+            elif type(value) is str and within:
+                # Interned so the en/pl set difference can match equal keys by identity
+                out_set.add(sys.intern(current_key))
+
+def load_key_skeleton(f):
+    # Stream a file into its dict structure only, with '' standing in for every string value.
+    # Later duplicate keys replace earlier ones exactly as a full parse would; arrays are dropped.
+    # Trade-off: on today's locale files this is about 2x slower than orjson + extract_keys_into and
+    # no smaller at peak; it only pays off on multi-megabyte files (~6 MB: 3.9 MB vs 13.7 MB peak).
+    # sync_locales needs the values too, so it parses with orjson and gets the same keys
+    root = None
+    stack = []
+    key = None
+    skip_depth = 0
+    for event, value in ijson.basic_parse(f):
+        if skip_depth:
+            if event == 'start_array' or event == 'start_map':
+                skip_depth += 1
+            elif event == 'end_array' or event == 'end_map':
+                skip_depth -= 1
+            continue
+        if event == 'map_key':
+            key = value
+            continue
+        if event == 'end_map':
+            stack.pop()
+            continue
+        if event == 'start_map':
+            node = {}
+        elif event == 'string':
+            node = ''
+        else:
+            node = None
+            if event == 'start_array':
+                skip_depth = 1
+        if stack:
+            stack[-1][key] = node
+        else:
+            root = node
+        if event == 'start_map':
+            stack.append(node)
+    return root
 
 def get_keys_for_language(lang_code, namespace):
     file_path = f"public/locales/{lang_code}/{namespace}.json"
-    keys = []
+    keys = set()
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-            if not content.strip():
+        with open(file_path, 'rb') as f:
+            if not os.fstat(f.fileno()).st_size:
                 print(f"Warning: File is empty {file_path}", file=sys.stderr)
                 return set() # Return empty set for empty file
-            json_data = json.loads(content)
-            keys = extract_keys_recursive(json_data)
+            extract_keys_into(load_key_skeleton(f), keys)
     except FileNotFoundError:
         print(f"Error: File not found {file_path}", file=sys.stderr)
         return set() # Return empty set if file not found
-    except json.JSONDecodeError:
+    except ijson.JSONError:
         print(f"Error: Could not decode JSON from {file_path}", file=sys.stderr)
         return set() # Return empty set for JSON errors
     except Exception as e:
         print(f"An unexpected error occurred with {file_path}: {e}", file=sys.stderr)
         return set() # Return empty set for other errors
-    return set(keys)
+    return keys
+
+def get_keys_from_data(json_data, allowed_prefixes=None):
+    # Same as get_keys_for_language, for a document that has already been parsed
+    keys = set()
+    extract_keys_into(json_data, keys, allowed_prefixes=allowed_prefixes)
+    return keys
+
+def write_missing_keys(results):
+    # Outputting in the specified format, one line per namespace in a single write
+    lines = []
+    for key_name, key_list in results.items():
+        keys_str = ", ".join(f'"{k}"' for k in key_list)
+        lines.append(f"{key_name}: [{keys_str}]")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 def main():
-    namespaces = ["common", "entities", "ui"]
+    namespaces = NAMESPACES
     results = {}
 
     for ns in namespaces:
         en_keys = get_keys_for_language("en", ns)
         pl_keys = get_keys_for_language("pl", ns)
-        
-        missing_keys = sorted(list(en_keys - pl_keys))
+
+        missing_keys = sorted(en_keys - pl_keys)
         results[f"missing_pl_{ns}_keys"] = missing_keys
 
-    # Outputting in the specified format
-    for key_name, key_list in results.items():
-        keys_str = ", ".join([f'"{k}"' for k in key_list])
-        print(f"{key_name}: [{keys_str}]")
+    write_missing_keys(results)
 
 if __name__ == "__main__":
     main()
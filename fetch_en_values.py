@@ -1,68 +1,81 @@
-import json
 import sys
 
-def get_value_from_nested_dict(data_dict, key_string):
-    keys = key_string.split('.')
-    current_val = data_dict
-    for k in keys:
-        if isinstance(current_val, dict) and k in current_val:
-            current_val = current_val[k]
-        else:
-            return None  # Key not found or path is invalid
-    return current_val if isinstance(current_val, str) else None # Ensure we only return strings
+import orjson
 
-def main():
-    target_keys = [
-      "forms.tabs.advanced", "forms.tabs.basic", "forms.tabs.details", 
-      "forms.tabs.history", "forms.tabs.metadata", "forms.tabs.notes", 
-      "forms.tabs.permissions", "forms.tabs.properties", "forms.tabs.relationships", 
-      "forms.tabs.secrets", "forms.validation.categoryRequired", 
-      "forms.validation.descriptionRequired", "forms.validation.fileTooLarge", 
-      "forms.validation.invalidFileType", "forms.validation.nameRequired", 
-      "forms.validation.passwordTooShort", "forms.validation.passwordsDoNotMatch", 
-      "forms.validation.titleRequired", "forms.validation.typeRequired"
-    ]
-    
-    ui_en_file_path = "public/locales/en/ui.json"
+from locale_io import load_json
+
+_LEAF = object() # Marks the trie node where a target key ends
+
+def build_key_trie(key_strings):
+    trie = {}
+    for key_string in key_strings:
+        current_node = trie
+        for k in key_string.split('.'):
+            current_node = current_node.setdefault(k, {})
+        current_node[_LEAF] = key_string
+    return trie
+
+def collect_trie_values(data_dict, trie_node, found):
+    # Single pass over the data, descending only along paths that lead to a target key
+    for k, child_node in trie_node.items():
+        if k is _LEAF or k not in data_dict:
+            continue
+        value = data_dict[k]
+        if isinstance(value, str):
+            if _LEAF in child_node:
+                found[child_node[_LEAF]] = value # Ensure we only return strings
+        elif isinstance(value, dict):
+            collect_trie_values(value, child_node, found)
+
+TARGET_KEYS = [
+  "forms.tabs.advanced", "forms.tabs.basic", "forms.tabs.details", 
+  "forms.tabs.history", "forms.tabs.metadata", "forms.tabs.notes", 
+  "forms.tabs.permissions", "forms.tabs.properties", "forms.tabs.relationships", 
+  "forms.tabs.secrets", "forms.validation.categoryRequired", 
+  "forms.validation.descriptionRequired", "forms.validation.fileTooLarge", 
+  "forms.validation.invalidFileType", "forms.validation.nameRequired", 
+  "forms.validation.passwordTooShort", "forms.validation.passwordsDoNotMatch", 
+  "forms.validation.titleRequired", "forms.validation.typeRequired"
+]
+
+# The target keys never change, so their trie is built once, at import
+_TARGET_TRIE = build_key_trie(TARGET_KEYS)
+
+UI_EN_FILE_PATH = "public/locales/en/ui.json"
+
+def collect_en_values(ui_en_data, source_path=UI_EN_FILE_PATH):
+    # Look up every target key in already-parsed English UI data
     results = {}
+    found = {}
+    if isinstance(ui_en_data, dict):
+        collect_trie_values(ui_en_data, _TARGET_TRIE, found)
 
-    try:
-        with open(ui_en_file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-            if not content.strip():
-                print(f"Error: File is empty {ui_en_file_path}", file=sys.stderr)
-                # Output empty JSON if file is unusable, to maintain structure
-                print(json.dumps({}))
-                return
+    for key in TARGET_KEYS:
+        value = found.get(key)
+        if value is not None:
+            results[key] = value
+        else:
+            results[key] = f"ERROR: Value for key '{key}' not found or not a string."
+            print(f"Warning: Value for key '{key}' not found or not a string in {source_path}", file=sys.stderr)
+    return results
 
-            ui_en_data = json.loads(content)
-            
-            for key in target_keys:
-                value = get_value_from_nested_dict(ui_en_data, key)
-                if value is not None:
-                    results[key] = value
-                else:
-                    results[key] = f"ERROR: Value for key '{key}' not found or not a string."
-                    print(f"Warning: Value for key '{key}' not found or not a string in {ui_en_file_path}", file=sys.stderr)
-                    
-    except FileNotFoundError:
-        print(f"Error: File not found {ui_en_file_path}", file=sys.stderr)
-        # Output empty JSON if file is unusable
-        print(json.dumps({}))
-        return
-    except json.JSONDecodeError:
-        print(f"Error: Could not decode JSON from {ui_en_file_path}", file=sys.stderr)
-        # Output empty JSON if file is unusable
-        print(json.dumps({}))
-        return
-    except Exception as e:
-        print(f"An unexpected error occurred with {ui_en_file_path}: {e}", file=sys.stderr)
-        # Output empty JSON if file is unusable
-        print(json.dumps({}))
+def print_results(results):
+    # Outputting the results as a JSON string; orjson gives bytes, so flush pending text and write to the binary stream
+    sys.stdout.flush()
+    sys.stdout.buffer.write(orjson.dumps(results, option=orjson.OPT_INDENT_2) + b"\n")
+
+def main():
+    try:
+        ui_en_data = load_json(UI_EN_FILE_PATH)
+    except OSError as e:
+        print(f"An unexpected error occurred with {UI_EN_FILE_PATH}: {e}", file=sys.stderr)
+        ui_en_data = None
+    if ui_en_data is None:
+        # Output empty JSON if file is unusable, to maintain structure
+        print_results({})
         return
 
-    # Outputting the results as a JSON string
-    print(json.dumps(results, indent=2))
+    print_results(collect_en_values(ui_en_data, UI_EN_FILE_PATH))
 
 if __name__ == "__main__":
     main()
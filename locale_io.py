@@ -0,0 +1,30 @@
+import os
+import sys
+
+import orjson
+
+def _slurp(path):
+    # Read the whole file with a single read() sized by fstat; an empty file is detected by the stat alone
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        return os.read(fd, size) if size else b""
+    finally:
+        os.close(fd)
+
+def load_json(path, default=None, missing=None, missing_message="Error: File not found {path}"):
+    # Parse a JSON file. A missing file returns missing and an empty or undecodable one returns default,
+    # each reported on stderr; any other read error (permissions, I/O, a directory) is raised to the caller
+    try:
+        content = _slurp(path)
+    except FileNotFoundError:
+        print(missing_message.format(path=path), file=sys.stderr)
+        return missing
+    if not content:
+        print(f"Warning: File is empty {path}", file=sys.stderr)
+        return default
+    try:
+        return orjson.loads(content)
+    except orjson.JSONDecodeError:
+        print(f"Error: Could not decode JSON from {path}", file=sys.stderr)
+        return default
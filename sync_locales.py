@@ -0,0 +1,45 @@
+# Runs extract_keys -> fetch_en_values -> update_pl_ui in one process,
+# parsing each locale file once and handing the parsed data between stages
+
+import sys
+
+from extract_keys import NAMESPACES, get_keys_from_data, write_missing_keys
+from fetch_en_values import UI_EN_FILE_PATH, collect_en_values, print_results
+from locale_io import load_json
+from update_pl_ui import TARGET_FILE_PATH, load_existing_data, merge_translations, write_locale_file
+
+def load_locale(lang_code, namespace):
+    # Read-only inputs: report an unreadable file and carry on, as the individual scripts do
+    file_path = f"public/locales/{lang_code}/{namespace}.json"
+    try:
+        return load_json(file_path)
+    except OSError as e:
+        print(f"An unexpected error occurred with {file_path}: {e}", file=sys.stderr)
+        return None
+
+def main():
+    # pl/ui is written back at the end, so it is loaded first and the same way update_pl_ui loads it:
+    # only a missing, empty or undecodable file starts fresh, anything else aborts before any output
+    documents = {("pl", "ui"): load_existing_data(TARGET_FILE_PATH)}
+    for ns in NAMESPACES:
+        for lang in ("en", "pl"):
+            if (lang, ns) not in documents:
+                documents[lang, ns] = load_locale(lang, ns)
+
+    # extract_keys: Polish keys missing per namespace, computed before the merge below changes pl/ui
+    results = {}
+    for ns in NAMESPACES:
+        en_keys = get_keys_from_data(documents["en", ns])
+        pl_keys = get_keys_from_data(documents["pl", ns])
+        results[f"missing_pl_{ns}_keys"] = sorted(en_keys - pl_keys)
+    write_missing_keys(results)
+
+    # fetch_en_values: English source strings for the keys being translated
+    ui_en_data = documents["en", "ui"]
+    print_results(collect_en_values(ui_en_data, UI_EN_FILE_PATH) if ui_en_data is not None else {})
+
+    # update_pl_ui: merge into the Polish UI data parsed above and write it back
+    write_locale_file(TARGET_FILE_PATH, merge_translations(documents["pl", "ui"]))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+import io
+import os
+import tempfile
+import unittest
+
+import ijson
+import orjson
+
+from extract_keys import extract_keys_into, get_keys_for_language, load_key_skeleton
+
+def skeleton_keys(raw):
+    keys = set()
+    extract_keys_into(load_key_skeleton(io.BytesIO(raw)), keys)
+    return keys
+
+def parsed_keys(raw):
+    keys = set()
+    extract_keys_into(orjson.loads(raw), keys)
+    return keys
+
+class LoadKeySkeletonTest(unittest.TestCase):
+    def assertSameKeys(self, raw, expected):
+        self.assertEqual(skeleton_keys(raw), expected)
+        self.assertEqual(parsed_keys(raw), expected)
+
+    def test_nested_string_leaves(self):
+        self.assertSameKeys(b'{"a": {"b": "x", "c": {"d": "y"}}, "e": "z", "n": 1, "t": true, "u": null}', {"a.b", "a.c.d", "e"})
+
+    def test_duplicate_keys_last_one_wins(self):
+        self.assertSameKeys(b'{"a": {"b": "x"}, "a": {"c": "y"}}', {"a.c"})
+        self.assertSameKeys(b'{"a": "x", "a": {"b": "y"}}', {"a.b"})
+        self.assertSameKeys(b'{"a": {"b": "y"}, "a": "x"}', {"a"})
+        self.assertSameKeys(b'{"a": {"b": "y"}, "a": 1}', set())
+
+    def test_arrays_are_skipped(self):
+        self.assertSameKeys(b'{"a": ["x", {"b": "y"}], "c": "z"}', {"c"})
+        self.assertSameKeys(b'{"a": [["x", {"b": [{"c": "y"}]}], []], "d": {"e": "z"}}', {"d.e"})
+
+    def test_top_level_non_dict(self):
+        for raw in (b'["x", {"a": "y"}]', b'"x"', b'1', b'null'):
+            with self.subTest(raw=raw):
+                self.assertEqual(skeleton_keys(raw), set())
+
+    def test_trailing_garbage_raises(self):
+        with self.assertRaises(ijson.JSONError):
+            load_key_skeleton(io.BytesIO(b'{"a": "x"} xyz'))
+
+    def test_matches_full_parse_on_locale_files(self):
+        locales_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "public", "locales")
+        for lang in sorted(os.listdir(locales_dir)):
+            for name in sorted(os.listdir(os.path.join(locales_dir, lang))):
+                with self.subTest(file=f"{lang}/{name}"):
+                    with open(os.path.join(locales_dir, lang, name), 'rb') as f:
+                        raw = f.read()
+                    self.assertEqual(skeleton_keys(raw), parsed_keys(raw))
+
+class GetKeysForLanguageTest(unittest.TestCase):
+    def setUp(self):
+        self.old_cwd = os.getcwd()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp_dir.name)
+        os.makedirs("public/locales/en")
+
+    def tearDown(self):
+        os.chdir(self.old_cwd)
+        self.tmp_dir.cleanup()
+
+    def write(self, content):
+        with open("public/locales/en/ui.json", 'wb') as f:
+            f.write(content)
+
+    def test_reads_keys(self):
+        self.write(b'{"a": {"b": "x"}}')
+        self.assertEqual(get_keys_for_language("en", "ui"), {"a.b"})
+
+    def test_unusable_files_give_empty_set(self):
+        for content in (b'', b'{"a": ', b'{"a": "x"} xyz'):
+            with self.subTest(content=content):
+                self.write(content)
+                self.assertEqual(get_keys_for_language("en", "ui"), set())
+        self.assertEqual(get_keys_for_language("en", "missing"), set())
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,72 +1,97 @@
-import json
+import os
 import sys
-from collections import OrderedDict
 
-def set_nested_value(data_dict, key_string, value):
-    keys = key_string.split('.')
-    current_level = data_dict
-    for i, k in enumerate(keys):
-        if i == len(keys) - 1: # Last key, set the value
-            current_level[k] = value
-        else:
-            if k not in current_level or not isinstance(current_level[k], dict):
-                # If key doesn't exist or is not a dict, create/overwrite with an OrderedDict
-                current_level[k] = OrderedDict()
-            current_level = current_level[k]
+import orjson
 
-def main():
-    new_translations = {
-      "forms.tabs.advanced": "Zaawansowane",
-      "forms.tabs.basic": "Podstawowe informacje",
-      "forms.tabs.details": "Szczegóły",
-      "forms.tabs.history": "Historia",
-      "forms.tabs.metadata": "Metadane",
-      "forms.tabs.notes": "Notatki",
-      "forms.tabs.permissions": "Uprawnienia",
-      "forms.tabs.properties": "Właściwości",
-      "forms.tabs.relationships": "Relacje",
-      "forms.tabs.secrets": "Sekrety MG",
-      "forms.validation.categoryRequired": "Kategoria jest wymagana",
-      "forms.validation.descriptionRequired": "Opis jest wymagany",
-      "forms.validation.fileTooLarge": "Plik jest za duży (maks. {{maxSize}})",
-      "forms.validation.invalidFileType": "Nieprawidłowy typ pliku (dozwolone: {{allowedTypes}})",
-      "forms.validation.nameRequired": "Nazwa jest wymagana",
-      "forms.validation.passwordTooShort": "Hasło musi mieć co najmniej 8 znaków",
-      "forms.validation.passwordsDoNotMatch": "Hasła się nie zgadzają",
-      "forms.validation.titleRequired": "Tytuł jest wymagany",
-      "forms.validation.typeRequired": "Typ jest wymagany"
-    }
-    
-    target_file_path = "public/locales/pl/ui.json"
-    existing_data = OrderedDict() # Use OrderedDict to preserve key order as much as possible
+from locale_io import load_json
 
-    try:
-        with open(target_file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-            if content.strip(): # If file is not empty
-                existing_data = json.loads(content, object_pairs_hook=OrderedDict)
-            else:
-                print(f"Info: File '{target_file_path}' was empty. Starting with new translations.", file=sys.stderr)
-    except FileNotFoundError:
-        print(f"Info: File '{target_file_path}' not found. A new file will be created with the translations.", file=sys.stderr)
-    except json.JSONDecodeError:
-        print(f"Error: Could not decode JSON from '{target_file_path}'. Starting with a fresh structure for new translations.", file=sys.stderr)
-        # Reset existing_data to ensure a clean slate if JSON is corrupt
-        existing_data = OrderedDict()
+def group_by_parent(translations):
+    # Group dotted keys by their parent path so each parent is walked to only once
+    grouped = {}
+    for key_string, value in translations.items():
+        *parent_keys, leaf = key_string.split('.')
+        grouped.setdefault(tuple(parent_keys), {})[leaf] = value
+    return grouped
+
+# Keys are split into (parent path, {leaf: value}) groups once, at import
+_NEW_TRANSLATIONS = group_by_parent({
+  "forms.tabs.advanced": "Zaawansowane",
+  "forms.tabs.basic": "Podstawowe informacje",
+  "forms.tabs.details": "Szczegóły",
+  "forms.tabs.history": "Historia",
+  "forms.tabs.metadata": "Metadane",
+  "forms.tabs.notes": "Notatki",
+  "forms.tabs.permissions": "Uprawnienia",
+  "forms.tabs.properties": "Właściwości",
+  "forms.tabs.relationships": "Relacje",
+  "forms.tabs.secrets": "Sekrety MG",
+  "forms.validation.categoryRequired": "Kategoria jest wymagana",
+  "forms.validation.descriptionRequired": "Opis jest wymagany",
+  "forms.validation.fileTooLarge": "Plik jest za duży (maks. {{maxSize}})",
+  "forms.validation.invalidFileType": "Nieprawidłowy typ pliku (dozwolone: {{allowedTypes}})",
+  "forms.validation.nameRequired": "Nazwa jest wymagana",
+  "forms.validation.passwordTooShort": "Hasło musi mieć co najmniej 8 znaków",
+  "forms.validation.passwordsDoNotMatch": "Hasła się nie zgadzają",
+  "forms.validation.titleRequired": "Tytuł jest wymagany",
+  "forms.validation.typeRequired": "Typ jest wymagany"
+})
+
+TARGET_FILE_PATH = "public/locales/pl/ui.json"
 
+def merge_translations(existing_data):
+    # Merge the new translations into already-parsed Polish UI data, in place
+    for parent_keys, values in _NEW_TRANSLATIONS.items():
+        current_level = existing_data
+        for k in parent_keys:
+            next_level = current_level.get(k)
+            if not isinstance(next_level, dict):
+                # If key doesn't exist or is not a dict, create/overwrite with a new dict
+                next_level = current_level[k] = {}
+            current_level = next_level
+        current_level.update(values)
+    return existing_data
 
-    # Merge new translations
-    for key, value in new_translations.items():
-        set_nested_value(existing_data, key, value)
-        
-    # Write the updated data back to the file
+def write_locale_file(target_file_path, data):
+    # Write the updated data to a temporary file and swap it in, so an interrupted run never leaves a half-written file
+    output = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS) # Using indent=2 for readability
+    tmp_file_path = target_file_path + ".tmp"
     try:
-        with open(target_file_path, 'w', encoding='utf-8') as f:
-            json.dump(existing_data, f, ensure_ascii=False, indent=2) # Using indent=2 for readability
+        with open(tmp_file_path, 'wb', buffering=65536) as f:
+            f.write(output)
+        os.replace(tmp_file_path, target_file_path)
         print(f"Successfully updated '{target_file_path}' with new translations.", file=sys.stdout)
     except IOError as e:
+        try:
+            os.unlink(tmp_file_path)
+        except OSError:
+            pass # Nothing was written, or the temporary file is already gone
         print(f"Error: Could not write to file '{target_file_path}': {e}", file=sys.stderr)
         sys.exit(1) # Exit with error status if write fails
 
+def load_existing_data(target_file_path):
+    # Only a missing, empty or undecodable file starts a fresh structure; any other problem
+    # aborts before anything is written, so an unreadable file is never replaced
+    try:
+        existing_data = load_json(
+            target_file_path,
+            missing={},
+            missing_message="Info: File '{path}' not found. A new file will be created with the translations.",
+        )
+    except OSError as e:
+        print(f"Error: Could not read '{target_file_path}': {e}. Leaving it untouched.", file=sys.stderr)
+        sys.exit(1)
+    if existing_data is None:
+        print(f"Info: Starting with a fresh structure for new translations in '{target_file_path}'.", file=sys.stderr)
+        return {} # dicts preserve insertion order, so key order survives the round trip
+    if not isinstance(existing_data, dict):
+        print(f"Error: '{target_file_path}' does not contain a JSON object. Leaving it untouched.", file=sys.stderr)
+        sys.exit(1)
+    return existing_data
+
+def main():
+    existing_data = load_existing_data(TARGET_FILE_PATH)
+    merge_translations(existing_data)
+    write_locale_file(TARGET_FILE_PATH, existing_data)
+
 if __name__ == "__main__":
     main()